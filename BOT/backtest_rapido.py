@@ -0,0 +1,122 @@
+import csv
+import config  # Importa as configurações do arquivo config.py
+
+# Backtest sem pandas para rodar a partir de um CSV de candles (cache ou --arquivo).
+# Reproduz TradingStrategy.calculate_signals e Backtester.run com listas, evitando o
+# custo de importar pandas/numpy quando não há gráficos a exibir.
+
+def ler_closes(caminho: str, limit: int = None):
+    """
+    Lê os preços de fechamento de um CSV de candles.
+    Parâmetros:
+        caminho (str): Caminho do CSV com a coluna 'close'
+        limit (int): Mantém apenas os últimos candles (opcional)
+    Retorna:
+        list: Preços de fechamento
+    """
+    with open(caminho, newline='', encoding='utf-8') as f:
+        closes = [float(row['close']) for row in csv.DictReader(f)]
+    return closes[-limit:] if limit else closes
+
+def media_exponencial(valores, span):
+    """
+    Média móvel exponencial equivalente a Series.ewm(span=span, adjust=False).mean().
+    As operações seguem a mesma ordem do pandas para produzir os mesmos valores.
+    """
+    alpha = 1. / (1. + (span - 1) / 2.)
+    old_wt = 1. - alpha
+    medias = []
+    weighted = None
+    for valor in valores:
+        if weighted is None:
+            weighted = valor
+        else:
+            weighted = (old_wt * weighted + alpha * valor) / (old_wt + alpha)
+        medias.append(weighted)
+    return medias
+
+def calcular_sinais(closes, short_window=config.MArapida, long_window=config.MAlenta):
+    """
+    Sinais de cruzamento de médias: 1 compra, -1 venda, 0 neutro.
+    """
+    curtas = media_exponencial(closes, short_window)
+    longas = media_exponencial(closes, long_window)
+    return [1 if c > l else -1 if c < l else 0 for c, l in zip(curtas, longas)]
+
+def simular(closes, sinais, initial_balance=config.saldo_backtest, fee=0.04):
+    """
+    Simula as operações com a mesma regra de Backtester.run.
+    Retorna:
+        tuple: Saldo final e lista de operações
+    """
+    balance = initial_balance
+    position = 0  # 1 para comprado, -1 para vendido, 0 para fora
+    entry_price = 0
+    entry_size = 0
+    trades = []
+    for i in range(1, len(closes)):
+        signal = sinais[i]
+        price = closes[i]
+        if signal == 1 and position <= 0:
+            # Fecha venda se houver
+            if position == -1:
+                pnl = (entry_price - price) * entry_size - (price + entry_price) * entry_size * fee
+                balance += pnl
+                trades.append({'type': 'COVER', 'price': price, 'balance': balance})
+            # Abre compra
+            entry_size = config.valor_fixo_usdt / price
+            entry_price = price
+            position = 1
+            trades.append({'type': 'BUY', 'price': price, 'balance': balance})
+        elif signal == -1 and position >= 0:
+            # Fecha compra se houver
+            if position == 1:
+                pnl = (price - entry_price) * entry_size - (price + entry_price) * entry_size * fee
+                balance += pnl
+                trades.append({'type': 'SELL', 'price': price, 'balance': balance})
+            # Abre venda
+            entry_size = config.valor_fixo_usdt / price
+            entry_price = price
+            position = -1
+            trades.append({'type': 'SHORT', 'price': price, 'balance': balance})
+    # Fecha posição aberta no final da simulação
+    if position != 0:
+        price = closes[-1]
+        if position == 1:
+            pnl = (price - entry_price) * entry_size - (price + entry_price) * entry_size * fee
+        else:
+            pnl = (entry_price - price) * entry_size - (price + entry_price) * entry_size * fee
+        balance += pnl
+        trades.append({'type': 'CLOSE', 'price': price, 'balance': balance})
+    return balance, trades
+
+def calcular_metricas(trades, saldo_inicial=config.saldo_backtest):
+    """
+    Fator de lucro e drawdown máximo, como em run_backtest.calcular_metricas.
+    """
+    saldos = [saldo_inicial] + [t['balance'] for t in trades]
+    lucros = [b - a for a, b in zip(saldos, saldos[1:])]
+    ganhos = sum(l for l in lucros if l > 0)
+    perdas = -sum(l for l in lucros if l < 0)
+    pico = saldos[0]
+    max_drawdown = 0.0
+    for saldo in saldos:
+        pico = max(pico, saldo)
+        max_drawdown = min(max_drawdown, (saldo - pico) / pico)
+    return {
+        'fator_lucro': ganhos / perdas if perdas != 0 else float('inf'),
+        'max_drawdown': max_drawdown
+    }
+
+def main(caminho, limit=None, short_window=config.MArapida, long_window=config.MAlenta):
+    closes = ler_closes(caminho, limit)
+    if not closes:
+        print('Erro ao obter dados históricos.')
+        return 1
+    sinais = calcular_sinais(closes, short_window, long_window)
+    final_balance, trades = simular(closes, sinais)
+    metricas = calcular_metricas(trades)
+    print(f'Saldo Final: {final_balance:.2f}')
+    print(f'Fator de Lucro: {metricas["fator_lucro"]:.2f}')
+    print(f'Max Drawdown: {metricas["max_drawdown"]:.2%}')
+    return 0
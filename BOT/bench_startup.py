@@ -0,0 +1,73 @@
+import csv
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import config
+
+# Mede o tempo total da CLI em processos novos, incluindo o backtest offline.
+# Meta: menos de 200 ms para --help, report e backtest --sem-graficos sobre dados locais.
+META_MS = 200
+REPETICOES = 5
+CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cli.py')
+PESADOS = ('ccxt', 'pandas', 'numpy', 'matplotlib')
+
+def medir(argv, repeticoes=REPETICOES):
+    """
+    Executa a CLI várias vezes e retorna a mediana do tempo em milissegundos.
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, CLI] + argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+def modulos_pesados_no_import():
+    """
+    Retorna os módulos pesados carregados ao importar a CLI.
+    """
+    codigo = f"import sys, cli; print(','.join(m for m in {PESADOS!r} if m in sys.modules))"
+    saida = subprocess.run([sys.executable, '-c', codigo], cwd=os.path.dirname(CLI),
+                           capture_output=True, text=True, check=True)
+    return [m for m in saida.stdout.strip().split(',') if m]
+
+def gravar_candles(caminho, n=config.limite_backtest):
+    """
+    Grava um CSV de candles sintéticos no mesmo formato do cache.
+    """
+    with open(caminho, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        for i in range(n):
+            preco = 100 + 10 * math.sin(i / 20)
+            writer.writerow([f'2010-01-01 {i % 24:02d}:00:00', preco, preco, preco, preco, 1.0])
+
+def main():
+    print(f'Módulos pesados ao importar cli: {modulos_pesados_no_import() or "nenhum"}')
+    acima = False
+    with tempfile.TemporaryDirectory() as pasta:
+        # Arquivos temporários: a medição não depende do cache local nem da Binance
+        trades = os.path.join(pasta, 'trades.json')
+        with open(trades, 'w', encoding='utf-8') as f:
+            json.dump([{'profit': 1.0}, {'profit': -0.5}], f)
+        candles = os.path.join(pasta, 'candles.csv')
+        gravar_candles(candles)
+        cenarios = [
+            ('--help', ['--help']),
+            ('report', ['report', '--arquivo', trades]),
+            (f'backtest ({config.limite_backtest} candles)', ['backtest', '--arquivo', candles, '--sem-graficos'])
+        ]
+        for nome, argv in cenarios:
+            ms = medir(argv)
+            status = 'OK' if ms < META_MS else 'ACIMA DA META'
+            acima = acima or ms >= META_MS
+            print(f'{nome}: {ms:.0f} ms ({status}, meta {META_MS} ms)')
+    return 1 if acima else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
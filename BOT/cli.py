@@ -0,0 +1,84 @@
+import argparse
+import os
+import config
+
+# Ponto de entrada único do bot.
+# Módulos pesados (ccxt, pandas, matplotlib) só são importados dentro do subcomando que precisa deles,
+# então comandos offline iniciam rápido e não dependem de conexão com a Binance.
+
+def cmd_live(args):
+    from main import main as live_main
+    live_main()
+    return 0
+
+def cmd_backtest(args):
+    # Sem gráficos e com dados locais: backtest em Python puro, sem importar pandas
+    if args.sem_graficos and not args.atualizar:
+        from dados import caminho_cache
+        caminho = args.arquivo or caminho_cache(args.simbolo, args.intervalo, args.limite)
+        if os.path.exists(caminho):
+            import backtest_rapido
+            return backtest_rapido.main(caminho, args.limite, args.rapida, args.lenta)
+    import run_backtest
+    return run_backtest.main(
+        symbol=args.simbolo,
+        interval=args.intervalo,
+        limit=args.limite,
+        short_window=args.rapida,
+        long_window=args.lenta,
+        arquivo=args.arquivo,
+        atualizar=args.atualizar,
+        graficos=not args.sem_graficos
+    )
+
+def cmd_optimize(args):
+    import otimizador_multi
+    print('Iniciando otimização multi-símbolo e multi-intervalo...')
+    resultados = otimizador_multi.otimizar_parametros(
+        symbols=args.simbolos or otimizador_multi.SYMBOLS,
+        intervals=args.intervalos or otimizador_multi.INTERVALS,
+        atualizar=args.atualizar
+    )
+    otimizador_multi.salvar_resultados(resultados)
+    return 0
+
+def cmd_report(args):
+    import relatorio
+    return relatorio.main(args.arquivo)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='bot', description='Bot de trading na Binance Futures')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    live = sub.add_parser('live', help='Executa o bot ao vivo')
+    live.set_defaults(func=cmd_live)
+
+    backtest = sub.add_parser('backtest', help='Executa o backtest da estratégia')
+    backtest.add_argument('--simbolo', default=config.simbolo)
+    backtest.add_argument('--intervalo', default=config.intervalo)
+    backtest.add_argument('--limite', type=int, default=config.limite_backtest)
+    backtest.add_argument('--rapida', type=int, default=config.MArapida, help='Média móvel curta')
+    backtest.add_argument('--lenta', type=int, default=config.MAlenta, help='Média móvel longa')
+    fonte = backtest.add_mutually_exclusive_group()
+    fonte.add_argument('--arquivo', help='CSV de candles a usar no lugar do cache (somente leitura)')
+    fonte.add_argument('--atualizar', action='store_true', help='Ignora o cache e baixa os dados novamente')
+    backtest.add_argument('--sem-graficos', action='store_true', help='Não exibe os gráficos (não importa matplotlib)')
+    backtest.set_defaults(func=cmd_backtest)
+
+    optimize = sub.add_parser('optimize', help='Otimiza as médias móveis para vários pares')
+    optimize.add_argument('--simbolos', nargs='+')
+    optimize.add_argument('--intervalos', nargs='+')
+    optimize.add_argument('--atualizar', action='store_true', help='Ignora o cache e baixa os dados novamente')
+    optimize.set_defaults(func=cmd_optimize)
+
+    report = sub.add_parser('report', help='Resume as operações registradas pelo bot ao vivo')
+    report.add_argument('--arquivo', default=config.arquivo_trades)
+    report.set_defaults(func=cmd_report)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,8 +1,8 @@
-import ccxt
 import dotenv
 import os
 import pandas as pd
 import logging
+from log_config import setup_logging
 
 # Carrega variáveis de ambiente do arquivo .env
 dotenv.load_dotenv()
@@ -16,42 +16,50 @@ class BinanceConnection:
             api_secret (str): Seu segredo de API da Binance
             testnet (bool): Se True, conecta na testnet de futuros
         """
-        # Configura o cliente ccxt para Binance Futures
-        if testnet:
-            self.client = ccxt.binance({
-                'apiKey': api_key,
-                'secret': api_secret,
-                'options': {'defaultType': 'future'},
-                'urls': {'api': {'public': 'https://testnet.binancefuture.com/fapi/v1',
-                                 'private': 'https://testnet.binancefuture.com/fapi/v1'}}
-            })
-        else:
-            self.client = ccxt.binance({
-                'apiKey': api_key,
-                'secret': api_secret,
-                'options': {'defaultType': 'future', 'adjustForTimeDifference': True}  # Adiciona ajuste de tempo
-            })
-        
-        # Sincroniza o tempo com o servidor
-        try:
-            self.client.load_time_difference()
-        except Exception as e:
-            self.logger.warning(f"Não foi possível sincronizar o tempo com o servidor: {e}")
-            
         self.setup_logging()
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.testnet = testnet
+        # O cliente ccxt só é criado no primeiro uso (ver propriedade client)
+        self._client = None
+
+    @property
+    def client(self):
+        """
+        Cliente ccxt da Binance Futures, criado sob demanda.
+        A importação do ccxt e a sincronização de tempo só acontecem no primeiro acesso.
+        """
+        if self._client is None:
+            import ccxt
+            # Configura o cliente ccxt para Binance Futures
+            if self.testnet:
+                client = ccxt.binance({
+                    'apiKey': self.api_key,
+                    'secret': self.api_secret,
+                    'options': {'defaultType': 'future'},
+                    'urls': {'api': {'public': 'https://testnet.binancefuture.com/fapi/v1',
+                                     'private': 'https://testnet.binancefuture.com/fapi/v1'}}
+                })
+            else:
+                client = ccxt.binance({
+                    'apiKey': self.api_key,
+                    'secret': self.api_secret,
+                    'options': {'defaultType': 'future', 'adjustForTimeDifference': True}  # Adiciona ajuste de tempo
+                })
+            
+            # Sincroniza o tempo com o servidor
+            try:
+                client.load_time_difference()
+            except Exception as e:
+                self.logger.warning(f"Não foi possível sincronizar o tempo com o servidor: {e}")
+            self._client = client
+        return self._client
     
     def setup_logging(self):
         """
         Configura o sistema de logs do bot.
         """
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('trading_bot.log'),
-                logging.StreamHandler()
-            ]
-        )
+        setup_logging()
         self.logger = logging.getLogger(__name__)
     
     def get_historical_klines(self, symbol: str, interval: str, limit: int = 100):
@@ -93,7 +101,9 @@ class BinanceConnection:
                 side=side,
                 amount=quantity
             )
-            self.logger.info(f"Ordem enviada com sucesso: {order}")
+            # Registra apenas os campos relevantes da ordem
+            self.logger.info("Ordem enviada com sucesso: id=%s %s %s %s status=%s",
+                             order.get('id'), side, quantity, symbol, order.get('status'))
             return order
         except Exception as e:
             self.logger.error(f"Erro ao enviar ordem: {str(e)}")
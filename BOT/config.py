@@ -1,6 +1,16 @@
+import os
+
 simbolo = 'SOL/USDT'
 intervalo = '1d'
 MArapida = 20
 MAlenta = 28
 saldo_backtest = 1000.0  # Saldo inicial para backtest
-valor_fixo_usdt = 20  # Valor fixo em USDT para cada operação
\ No newline at end of file
+limite_backtest = 5000  # Quantidade de candles usada no backtest
+valor_fixo_usdt = 20  # Valor fixo em USDT para cada operação
+log_arquivo = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'trading_bot.log')  # Arquivo de log (JSON lines)
+log_max_bytes = 5 * 1024 * 1024  # Tamanho máximo antes da rotação
+log_backups = 3  # Quantidade de arquivos antigos mantidos
+log_intervalo_ciclo = 60  # Segundos entre mensagens repetidas do loop
+
+dados_cache = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dados')  # Pasta do cache de candles
+arquivo_trades = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'trades.json')  # Histórico de operações do bot ao vivo
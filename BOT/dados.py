@@ -0,0 +1,60 @@
+import logging
+import os
+import config  # Importa as configurações do arquivo config.py
+
+logger = logging.getLogger(__name__)
+# Conexão compartilhada, criada apenas na primeira vez que um candle não está em cache
+_conn = None
+
+def conexao_padrao():
+    """
+    Retorna a conexão usada para baixar candles, criando-a no primeiro uso.
+    """
+    global _conn
+    if _conn is None:
+        from conexao import BinanceConnection
+        _conn = BinanceConnection(os.getenv('BINANCE_API_KEY', 'SUA_API_KEY'),
+                                  os.getenv('BINANCE_API_SECRET', 'SEU_API_SECRET'), testnet=False)
+    return _conn
+
+def caminho_cache(symbol: str, interval: str, limit: int) -> str:
+    """
+    Retorna o caminho do arquivo de cache para um par, intervalo e quantidade de candles.
+    A quantidade faz parte da chave porque a Binance pode devolver menos candles que o pedido.
+    """
+    return os.path.join(config.dados_cache, f"{symbol.replace('/', '')}_{interval}_{limit}.csv")
+
+def carregar_klines(symbol: str, interval: str, limit: int, atualizar: bool = False, arquivo: str = None, conn=None):
+    """
+    Carrega candles do cache local, buscando na Binance apenas quando necessário.
+    Parâmetros:
+        symbol (str): Par de negociação (ex: 'BTC/USDT')
+        interval (str): Intervalo do candle (ex: '1h', '4h', '1d')
+        limit (int): Quantidade de candles
+        atualizar (bool): Se True, ignora o cache e baixa os dados novamente
+        arquivo (str): CSV do usuário a usar no lugar do cache (somente leitura)
+        conn (BinanceConnection): Conexão a usar no lugar de conexao_padrao() (opcional)
+    Retorna:
+        pandas.DataFrame: Dados históricos de preços, ou None em caso de erro
+    """
+    import pandas as pd
+    # Arquivo informado pelo usuário: apenas leitura, nunca é baixado nem sobrescrito
+    if arquivo:
+        if not os.path.exists(arquivo):
+            raise FileNotFoundError(f"Arquivo de candles não encontrado: {arquivo}")
+        df = pd.read_csv(arquivo, parse_dates=['timestamp'])
+        if len(df) < limit:
+            logger.warning(f"{arquivo} tem apenas {len(df)} candles (pedido: {limit})")
+        return df.tail(limit).reset_index(drop=True)
+
+    caminho = caminho_cache(symbol, interval, limit)
+    if not atualizar and os.path.exists(caminho):
+        return pd.read_csv(caminho, parse_dates=['timestamp'])
+    # Sem cache: conecta na Binance (ccxt só é importado aqui)
+    if conn is None:
+        conn = conexao_padrao()
+    df = conn.get_historical_klines(symbol, interval, limit)
+    if df is not None:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        df.to_csv(caminho, index=False)
+    return df
@@ -0,0 +1,187 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+import config  # Importa as configurações do arquivo config.py
+
+# Listener global: garante que o logging seja configurado uma única vez
+_listener = None
+_queue_handler = None
+_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formata cada registro como uma linha JSON compacta.
+    """
+    def format(self, record):
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage()
+        }
+        if getattr(record, 'suprimidas', 0):
+            entry['suprimidas'] = record.suprimidas
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """
+    Formato legível para o terminal, indicando quantas repetições foram suprimidas.
+    """
+    def format(self, record):
+        texto = super().format(record)
+        if getattr(record, 'suprimidas', 0):
+            texto += f" ({record.suprimidas} repetições suprimidas)"
+        return texto
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que mantém o traceback em exc_text, separado da mensagem,
+    para que o JsonFormatter o grave no campo 'exc'.
+    """
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limita mensagens repetitivas do loop principal.
+    Apenas registros marcados com extra={'ciclo': '<tag>'} são limitados. A chave é o
+    logger mais a tag, e a mensagem só é suprimida se o texto for igual ao último
+    emitido; qualquer mudança (ex: posição aberta/fechada) passa imediatamente.
+    Quando o texto muda, as repetições suprimidas do texto anterior são enviadas
+    para emitir() em um registro de resumo com esse texto.
+    """
+    def __init__(self, intervalo: float = config.log_intervalo_ciclo, emitir=None):
+        super().__init__()
+        self.intervalo = intervalo
+        self.emitir = emitir
+        self._ultimos = {}
+        self._suprimidas = {}
+        self._lock = threading.Lock()
+
+    def _resumo(self, key):
+        # Cópia do último registro emitido para a chave, com a contagem de repetições suprimidas
+        suprimidas = self._suprimidas.pop(key, 0)
+        if not suprimidas:
+            return None
+        resumo = copy.copy(self._ultimos[key][2])
+        resumo.created = time.time()
+        resumo.msecs = (resumo.created - int(resumo.created)) * 1000
+        resumo.suprimidas = suprimidas
+        return resumo
+
+    def _emitir(self, resumos):
+        if self.emitir is not None:
+            for resumo in resumos:
+                self.emitir(resumo)
+
+    def filter(self, record):
+        # Avisos, erros e mensagens fora do ciclo sempre passam
+        if not getattr(record, 'ciclo', False) or record.levelno >= logging.WARNING:
+            return True
+        try:
+            texto = record.getMessage()
+        except Exception:
+            # Erro de formatação: deixa o registro seguir para o handler reportar (handleError)
+            return True
+        key = (record.name, record.ciclo)
+        now = time.monotonic()
+        resumos = []
+        with self._lock:
+            ultimo = self._ultimos.get(key)
+            if ultimo is not None and ultimo[1] == texto and now - ultimo[0] < self.intervalo:
+                self._suprimidas[key] = self._suprimidas.get(key, 0) + 1
+                return False
+            if ultimo is not None and ultimo[1] != texto:
+                resumos = [r for r in [self._resumo(key)] if r is not None]
+            record.suprimidas = self._suprimidas.pop(key, 0)
+            self._ultimos[key] = (now, texto, copy.copy(record))
+        self._emitir(resumos)
+        return True
+
+    def flush(self):
+        """
+        Emite as contagens pendentes de repetições suprimidas (usado ao encerrar).
+        """
+        with self._lock:
+            resumos = [r for r in (self._resumo(key) for key in list(self._suprimidas)) if r is not None]
+        self._emitir(resumos)
+
+
+def setup_logging(level=logging.INFO):
+    """
+    Configura o sistema de logs do bot uma única vez.
+    Os registros passam por uma fila e são gravados por uma thread em segundo plano,
+    então o loop de trading nunca espera por disco ou terminal.
+    Retorna:
+        logging.handlers.QueueListener: Listener responsável pela escrita
+    """
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is not None:
+            return _listener
+        # Arquivo com rotação por tamanho, em JSON lines
+        file_handler = logging.handlers.RotatingFileHandler(
+            config.log_arquivo,
+            maxBytes=config.log_max_bytes,
+            backupCount=config.log_backups,
+            encoding='utf-8'
+        )
+        file_handler.setFormatter(JsonFormatter())
+        # Terminal continua legível
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(ConsoleFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+        log_queue = queue.SimpleQueue()
+        _queue_handler = StructuredQueueHandler(log_queue)
+        _queue_handler.addFilter(RateLimitFilter(emitir=_queue_handler.emit))
+
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(_queue_handler)
+
+        _listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        _listener.start()
+        # Esvazia a fila ao encerrar o processo
+        atexit.register(stop_logging)
+        return _listener
+
+
+def stop_logging():
+    """
+    Grava os registros pendentes, encerra a thread de escrita e remove o handler da fila.
+    Chamadas repetidas são ignoradas.
+    """
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is None:
+            return
+        # Contagens de repetições ainda pendentes são gravadas antes de parar
+        for filtro in _queue_handler.filters:
+            if isinstance(filtro, RateLimitFilter):
+                filtro.flush()
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener = None
+        _queue_handler = None
@@ -8,6 +8,7 @@ import threading
 import json
 from datetime import datetime
 import config 
+from log_config import setup_logging
 
 # Carrega variáveis de ambiente do arquivo .env
 load_dotenv()
@@ -24,13 +25,12 @@ def bot_loop(run_event):
     connection = BinanceConnection(api_key, api_secret, testnet=True)  # Mudar para False em produção
     # Testa a conexão antes de iniciar o loop
     if not connection.test_connection():
-        logger.error("Falha ao conectar com a API da Binance. O bot será encerrado.")
-        print("[ERRO] Falha ao conectar com a API da Binance. Verifique suas credenciais e conexão com a internet.")
+        logger.error("Falha ao conectar com a API da Binance. Verifique suas credenciais e conexão com a internet.")
         return
     strategy = TradingStrategy(short_window=config.MArapida, long_window=config.MAlenta)
     symbol = config.simbolo  # Par de negociação para ccxt
     interval = config.intervalo    # Intervalo do candle
-    logger.info(f"Starting trading bot for {symbol} on {interval} timeframe")
+    logger.info("Starting trading bot for %s on %s timeframe", symbol, interval)
     trade_state = {
         'open': False,
         'side': None,
@@ -39,7 +39,7 @@ def bot_loop(run_event):
         'entry_volume': None
     }
     try:
-        print('Bot rodando')
+        logger.info('Bot rodando')
         while True:
             run_event.wait()
             # Busca dados históricos
@@ -54,16 +54,18 @@ def bot_loop(run_event):
                 for asset in balance['info']['assets']:
                     if asset['asset'] == 'USDT':
                         usdt_cross = float(asset['crossWalletBalance'])
-                print(f"Saldo USDT: {usdt_cross:.8f}")
+            if usdt_cross is not None:
+                # Mensagens do ciclo passam pelo limitador de repetição (ver log_config)
+                logger.info("Saldo USDT: %.8f", usdt_cross, extra={'ciclo': 'saldo'})
             else:
-                print("[ERRO] Não foi possível obter saldo em USDT.")
+                logger.error("Não foi possível obter saldo em USDT.")
             # Consulta posições abertas
             positions = balance['info']['positions'] if balance and 'info' in balance and 'positions' in balance['info'] else []
             open_positions = [p for p in positions if float(p.get('positionAmt', 0)) != 0]
             if open_positions:
-                print("Há posição aberta.")
+                logger.info("Há posição aberta.", extra={'ciclo': 'posicao'})
             else:
-                print("Nenhuma posição aberta.")
+                logger.info("Nenhuma posição aberta.", extra={'ciclo': 'posicao'})
             # Calcula sinais da estratégia
             df = strategy.calculate_signals(df)
             if df is None:
@@ -86,7 +88,7 @@ def bot_loop(run_event):
                 if not trade_state['open'] and position_size:
                     if current_signal == 1:
                         order = connection.place_order(symbol, 'buy', position_size)
-                        print(f"Abertura de operação: COMPRA {position_size} @ {current_price}")
+                        logger.info("Abertura de operação: COMPRA %s @ %s", position_size, current_price)
                         trade_state.update({
                             'open': True,
                             'side': 'buy',
@@ -96,7 +98,7 @@ def bot_loop(run_event):
                         })
                     elif current_signal == -1:
                         order = connection.place_order(symbol, 'sell', position_size)
-                        print(f"Abertura de operação: VENDA {position_size} @ {current_price}")
+                        logger.info("Abertura de operação: VENDA %s @ %s", position_size, current_price)
                         trade_state.update({
                             'open': True,
                             'side': 'sell',
@@ -117,10 +119,10 @@ def bot_loop(run_event):
                     pnl = (exit_price - trade_state['entry_price']) * trade_state['entry_volume']
                     if trade_state['side'] == 'sell':
                         pnl = -pnl
-                    print(f"Fechamento de operação: {trade_state['side'].upper()} lucro/prejuízo: {pnl:.2f}")
+                    logger.info("Fechamento de operação: %s lucro/prejuízo: %.2f", trade_state['side'].upper(), pnl)
                     # Salva trade no arquivo JSON
                     try:
-                        with open('BOT/trades.json', 'r+', encoding='utf-8') as f:
+                        with open(config.arquivo_trades, 'r+', encoding='utf-8') as f:
                             trades = json.load(f)
                             trades.append({
                                 'side': trade_state['side'],
@@ -148,19 +150,12 @@ def bot_loop(run_event):
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.exception(f"Unexpected error: {str(e)}")
 
 # Função principal que exibe o menu interativo e controla o bot
 def main():
-    # Configura o sistema de logs
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('trading_bot.log'),
-            logging.StreamHandler()
-        ]
-    )
+    # Configura o sistema de logs (fila + thread de escrita em segundo plano)
+    setup_logging()
     # Evento para controlar execução do bot (iniciar/pausar)
     run_event = threading.Event()
     run_event.set()  # Começa rodando imediatamente
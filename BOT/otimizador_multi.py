@@ -1,13 +1,8 @@
-import os
 import pandas as pd
-from conexao import BinanceConnection
 from backtest import Backtester, Optimizer
+from dados import carregar_klines
 from strategy import TradingStrategy
 
-# Carregue suas chaves da Binance do .env ou defina diretamente aqui
-API_KEY = os.getenv('BINANCE_API_KEY', 'SUA_API_KEY')
-API_SECRET = os.getenv('BINANCE_API_SECRET', 'SEU_API_SECRET')
-
 # Lista de símbolos e intervalos para testar
 SYMBOLS = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'ADA/USDT', 'XRP/USDT', 'SOL/USDT', 'HBAR/USDT', 'DOGE/USDT', 'MATIC/USDT', 'DOT/USDT', 'TRX/USDT', 'LTC/USDT', 'AVAX/USDT', 'LINK/USDT']
 INTERVALS = ['1h', '2h', '4h', '1d']
@@ -19,23 +14,20 @@ GRID = {
     'long_window': range(20, 100, 2)
 }
 
-def otimizar_parametros():
-    # Conecte-se à Binance
-    conn = BinanceConnection(API_KEY, API_SECRET, testnet=False)
-    
+def otimizar_parametros(symbols=SYMBOLS, intervals=INTERVALS, atualizar=False):
     # Dicionário para armazenar os melhores resultados
     melhores_resultados = {}
     
     # Para cada símbolo e intervalo
-    for symbol in SYMBOLS:
+    for symbol in symbols:
         melhores_resultados[symbol] = {}
         
-        for interval in INTERVALS:
+        for interval in intervals:
             print(f"\nOtimizando {symbol} - Intervalo: {interval}")
             
             try:
-                # Obtenha dados históricos
-                df = conn.get_historical_klines(symbol, interval, LIMIT)
+                # Obtenha dados históricos (cache local; a conexão com a Binance só é criada no primeiro download)
+                df = carregar_klines(symbol, interval, LIMIT, atualizar=atualizar)
                 
                 if df is None:
                     print(f'Erro ao obter dados para {symbol} - {interval}')
@@ -0,0 +1,45 @@
+import json
+import config  # Importa as configurações do arquivo config.py
+
+def resumir_trades(trades):
+    """
+    Calcula um resumo das operações registradas pelo bot ao vivo.
+    Parâmetros:
+        trades (list): Lista de operações no formato salvo em trades.json
+    Retorna:
+        dict: Quantidade de operações, acertos, lucro total, fator de lucro e drawdown máximo
+    """
+    lucros = [float(t.get('profit', 0)) for t in trades]
+    ganhos = sum(l for l in lucros if l > 0)
+    perdas = -sum(l for l in lucros if l < 0)
+    # Drawdown máximo sobre o lucro acumulado
+    acumulado = pico = max_drawdown = 0.0
+    for lucro in lucros:
+        acumulado += lucro
+        pico = max(pico, acumulado)
+        max_drawdown = max(max_drawdown, pico - acumulado)
+    return {
+        'operacoes': len(lucros),
+        'acertos': sum(1 for l in lucros if l > 0),
+        'lucro_total': sum(lucros),
+        'fator_lucro': ganhos / perdas if perdas != 0 else float('inf'),
+        'max_drawdown': max_drawdown
+    }
+
+def main(arquivo=config.arquivo_trades):
+    try:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            trades = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f'Erro ao ler {arquivo}: {e}')
+        return 1
+    resumo = resumir_trades(trades)
+    print(f'Operações: {resumo["operacoes"]}')
+    print(f'Acertos: {resumo["acertos"]}')
+    print(f'Lucro Total: {resumo["lucro_total"]:.2f}')
+    print(f'Fator de Lucro: {resumo["fator_lucro"]:.2f}')
+    print(f'Max Drawdown: {resumo["max_drawdown"]:.2f}')
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
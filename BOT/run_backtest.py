@@ -1,86 +1,116 @@
-import os
-import matplotlib.pyplot as plt
 import pandas as pd
-from conexao import BinanceConnection
 from backtest import Backtester
 from strategy import TradingStrategy
+from dados import carregar_klines
 import config
 
-# Carregue suas chaves da Binance do .env ou defina diretamente aqui
-API_KEY = os.getenv('BINANCE_API_KEY', 'SUA_API_KEY')
-API_SECRET = os.getenv('BINANCE_API_SECRET', 'SEU_API_SECRET')
-
 # Parâmetros de busca de dados
 SYMBOL = config.simbolo
-INTERVAL = config.intervalo  
-LIMIT = 5000
-
-# Conecte-se à Binance e obtenha os dados históricos
-df = None
-try:
-    conn = BinanceConnection(API_KEY, API_SECRET, testnet=False)
-    df = conn.get_historical_klines(SYMBOL, INTERVAL, LIMIT)
-except Exception as e:
-    print(f'Erro ao conectar ou obter dados: {e}')
-
-if df is None:
-    print('Erro ao obter dados históricos.')
-    exit()
-
-# Instancie o backtester
-backtester = Backtester()
-
-# Defina a estratégia
-strategy = TradingStrategy(short_window=config.MArapida, long_window=config.MAlenta)
-
-# Execute o backtest
-final_balance, trades = backtester.run(df, strategy)
-
-# Converter trades para DataFrame
-trades_df = pd.DataFrame(trades)
-# Adiciona o saldo inicial como primeiro ponto
-saldo_inicial = config.saldo_backtest
-trades_df = pd.concat([
-    pd.DataFrame([{'type': 'START', 'price': None, 'balance': saldo_inicial}]),
-    trades_df
-], ignore_index=True)
-
-# Gráfico da curva de capital
-plt.figure(figsize=(12, 6))
-plt.plot(trades_df['balance'], marker='o')
-plt.title('Curva de Capital')
-plt.xlabel('Operação')
-plt.ylabel('Saldo')
-plt.grid()
-plt.show()
-
-# Gráfico de lucro/prejuízo por operação
-lucros = trades_df['balance'].diff().fillna(0)
-plt.figure(figsize=(12, 4))
-plt.bar(trades_df.index, lucros)
-plt.title('Lucro/Prejuízo por Operação')
-plt.xlabel('Operação')
-plt.ylabel('Lucro/Prejuízo')
-plt.grid()
-plt.show()
-
-# Fator de lucro
-ganhos = lucros[lucros > 0].sum()
-perdas = -lucros[lucros < 0].sum()
-fator_lucro = ganhos / perdas if perdas != 0 else float('inf')
-print(f'Fator de Lucro: {fator_lucro:.2f}')
-
-# Drawdown
-acum = trades_df['balance'].cummax()
-drawdown = trades_df['balance'] - acum
-drawdown_pct = drawdown / acum
-max_drawdown = drawdown_pct.min()
-print(f'Max Drawdown: {max_drawdown:.2%}')
-
-plt.figure(figsize=(12, 4))
-plt.plot(drawdown_pct, color='red')
-plt.title('Drawdown (%)')
-plt.xlabel('Operação')
-plt.ylabel('Drawdown (%)')
-plt.grid()
-plt.show()
+INTERVAL = config.intervalo
+LIMIT = config.limite_backtest
+
+def executar_backtest(df, short_window=config.MArapida, long_window=config.MAlenta):
+    """
+    Executa o backtest e retorna o saldo final e as operações em um DataFrame.
+    """
+    # Instancie o backtester
+    backtester = Backtester()
+
+    # Defina a estratégia
+    strategy = TradingStrategy(short_window=short_window, long_window=long_window)
+
+    # Execute o backtest
+    final_balance, trades = backtester.run(df, strategy)
+
+    # Converter trades para DataFrame
+    trades_df = pd.DataFrame(trades)
+    # Adiciona o saldo inicial como primeiro ponto
+    saldo_inicial = config.saldo_backtest
+    trades_df = pd.concat([
+        pd.DataFrame([{'type': 'START', 'price': None, 'balance': saldo_inicial}]),
+        trades_df
+    ], ignore_index=True)
+    return final_balance, trades_df
+
+def calcular_metricas(trades_df):
+    """
+    Calcula lucro por operação, fator de lucro e drawdown a partir da curva de capital.
+    """
+    lucros = trades_df['balance'].diff().fillna(0)
+
+    # Fator de lucro
+    ganhos = lucros[lucros > 0].sum()
+    perdas = -lucros[lucros < 0].sum()
+    fator_lucro = ganhos / perdas if perdas != 0 else float('inf')
+
+    # Drawdown
+    acum = trades_df['balance'].cummax()
+    drawdown = trades_df['balance'] - acum
+    drawdown_pct = drawdown / acum
+    return {
+        'lucros': lucros,
+        'fator_lucro': fator_lucro,
+        'drawdown_pct': drawdown_pct,
+        'max_drawdown': drawdown_pct.min()
+    }
+
+def plotar_resultados(trades_df, metricas):
+    """
+    Exibe os gráficos do backtest. O matplotlib só é importado aqui.
+    """
+    import matplotlib.pyplot as plt
+
+    # Gráfico da curva de capital
+    plt.figure(figsize=(12, 6))
+    plt.plot(trades_df['balance'], marker='o')
+    plt.title('Curva de Capital')
+    plt.xlabel('Operação')
+    plt.ylabel('Saldo')
+    plt.grid()
+    plt.show()
+
+    # Gráfico de lucro/prejuízo por operação
+    plt.figure(figsize=(12, 4))
+    plt.bar(trades_df.index, metricas['lucros'])
+    plt.title('Lucro/Prejuízo por Operação')
+    plt.xlabel('Operação')
+    plt.ylabel('Lucro/Prejuízo')
+    plt.grid()
+    plt.show()
+
+    plt.figure(figsize=(12, 4))
+    plt.plot(metricas['drawdown_pct'], color='red')
+    plt.title('Drawdown (%)')
+    plt.xlabel('Operação')
+    plt.ylabel('Drawdown (%)')
+    plt.grid()
+    plt.show()
+
+def main(symbol=SYMBOL, interval=INTERVAL, limit=LIMIT, short_window=config.MArapida,
+         long_window=config.MAlenta, arquivo=None, atualizar=False, graficos=True):
+    # Usa o cache local de candles; só conecta na Binance se não houver dados salvos
+    df = None
+    try:
+        df = carregar_klines(symbol, interval, limit, atualizar=atualizar, arquivo=arquivo)
+    except FileNotFoundError as e:
+        print(f'Erro: {e}')
+        return 1
+    except Exception as e:
+        print(f'Erro ao conectar ou obter dados: {e}')
+
+    if df is None:
+        print('Erro ao obter dados históricos.')
+        return 1
+
+    final_balance, trades_df = executar_backtest(df, short_window, long_window)
+    metricas = calcular_metricas(trades_df)
+    print(f'Saldo Final: {final_balance:.2f}')
+    print(f'Fator de Lucro: {metricas["fator_lucro"]:.2f}')
+    print(f'Max Drawdown: {metricas["max_drawdown"]:.2%}')
+
+    if graficos:
+        plotar_resultados(trades_df, metricas)
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
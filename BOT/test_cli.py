@@ -0,0 +1,67 @@
+import csv
+import subprocess
+import sys
+import os
+import pytest
+import backtest_rapido
+import config
+from cli import build_parser
+from relatorio import resumir_trades
+
+def test_cli_nao_importa_modulos_pesados():
+    # Importar a CLI não deve carregar ccxt, pandas ou matplotlib
+    codigo = "import sys, cli; print([m for m in ('ccxt', 'pandas', 'matplotlib') if m in sys.modules])"
+    saida = subprocess.run([sys.executable, '-c', codigo], cwd=os.path.dirname(os.path.abspath(__file__)),
+                           capture_output=True, text=True, check=True)
+    assert saida.stdout.strip() == '[]'
+
+def test_cli_subcomandos():
+    parser = build_parser()
+    args = parser.parse_args(['backtest', '--sem-graficos', '--rapida', '5', '--lenta', '10'])
+    assert args.comando == 'backtest' and args.sem_graficos and args.rapida == 5
+    for comando in ('live', 'optimize', 'report'):
+        assert parser.parse_args([comando]).comando == comando
+
+def test_cli_arquivo_e_atualizar_exclusivos():
+    # --arquivo é somente leitura, então não combina com --atualizar
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(['backtest', '--arquivo', 'meu.csv', '--atualizar'])
+
+def test_arquivo_trades_independe_do_diretorio():
+    assert os.path.isabs(config.arquivo_trades)
+    assert os.path.dirname(config.arquivo_trades) == os.path.dirname(os.path.abspath(config.__file__))
+
+def test_backtest_offline_sem_pandas(tmp_path):
+    # backtest --sem-graficos com CSV local roda sem importar pandas, numpy ou ccxt
+    arquivo = tmp_path / 'candles.csv'
+    with open(arquivo, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        for i, preco in enumerate([10, 11, 12, 13, 12, 11, 10, 9, 10, 11, 12, 13, 14, 13, 12, 11, 10, 9, 8, 7]):
+            writer.writerow([f'2024-01-{i + 1:02d}', preco, preco, preco, preco, 1.0])
+    codigo = ("import sys, cli; rc = cli.main(['backtest', '--arquivo', sys.argv[1], '--sem-graficos', "
+              "'--rapida', '2', '--lenta', '3']); "
+              "print([m for m in ('ccxt', 'pandas', 'numpy', 'matplotlib') if m in sys.modules], rc)")
+    saida = subprocess.run([sys.executable, '-c', codigo, str(arquivo)], cwd=os.path.dirname(os.path.abspath(__file__)),
+                           capture_output=True, text=True, check=True)
+    assert 'Saldo Final' in saida.stdout
+    assert saida.stdout.strip().splitlines()[-1] == '[] 0'
+
+def test_media_exponencial():
+    # span=3 -> alpha=0.5
+    assert backtest_rapido.media_exponencial([10.0, 20.0, 20.0], 3) == [10.0, 15.0, 17.5]
+    assert backtest_rapido.calcular_sinais([10.0, 20.0, 5.0], 2, 3) == [0, 1, -1]
+
+def test_resumir_trades():
+    resumo = resumir_trades([{'profit': 10.0}, {'profit': -4.0}, {'profit': -2.0}, {'profit': 5.0}])
+    assert resumo['operacoes'] == 4
+    assert resumo['acertos'] == 2
+    assert resumo['lucro_total'] == 9.0
+    assert resumo['fator_lucro'] == 2.5
+    assert resumo['max_drawdown'] == 6.0
+
+if __name__ == '__main__':
+    test_cli_nao_importa_modulos_pesados()
+    test_cli_subcomandos()
+    test_arquivo_trades_independe_do_diretorio()
+    test_resumir_trades()
@@ -0,0 +1,144 @@
+import math
+import os
+import sys
+import types
+import pandas as pd
+import pytest
+import backtest_rapido
+import config
+import dados
+from backtest import Backtester
+from dados import caminho_cache, carregar_klines
+from strategy import TradingStrategy
+
+def make_klines(n=60):
+    # Candles sintéticos com tendência alternada para gerar cruzamentos de médias
+    close = [100 + 10 * math.sin(i / 5) for i in range(n)]
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='D'),
+        'open': close, 'high': close, 'low': close, 'close': close, 'volume': [1.0] * n
+    })
+
+class StubConnection:
+    def __init__(self, df):
+        self.df = df
+        self.chamadas = []
+
+    def get_historical_klines(self, symbol, interval, limit):
+        self.chamadas.append((symbol, interval, limit))
+        return self.df
+
+@pytest.fixture
+def sem_conexao(tmp_path, monkeypatch):
+    # Cache em pasta temporária e conexao falsa que falha se for usada
+    monkeypatch.setattr(config, 'dados_cache', str(tmp_path / 'dados'))
+    falso = types.ModuleType('conexao')
+    def proibido(*args, **kwargs):
+        raise AssertionError('Não deveria conectar na Binance')
+    falso.BinanceConnection = proibido
+    monkeypatch.setitem(sys.modules, 'conexao', falso)
+    monkeypatch.setattr(dados, '_conn', None)
+    return tmp_path
+
+def test_conexao_cria_cliente_sob_demanda(monkeypatch):
+    import conexao
+    monkeypatch.setattr(conexao, 'setup_logging', lambda: None)
+    monkeypatch.delitem(sys.modules, 'ccxt', raising=False)
+    conn = conexao.BinanceConnection('key', 'secret')
+    assert conn._client is None
+    assert 'ccxt' not in sys.modules
+    # ccxt falso: o cliente é criado e o tempo sincronizado no primeiro acesso
+    sincronizacoes = []
+    class FakeBinance:
+        def __init__(self, params):
+            self.params = params
+        def load_time_difference(self):
+            sincronizacoes.append(True)
+    monkeypatch.setitem(sys.modules, 'ccxt', types.SimpleNamespace(binance=FakeBinance))
+    client = conn.client
+    assert isinstance(client, FakeBinance)
+    assert conn.client is client
+    assert sincronizacoes == [True]
+
+def test_cache_hit_nao_conecta(sem_conexao):
+    caminho = caminho_cache('SOL/USDT', '1d', 60)
+    os.makedirs(config.dados_cache)
+    make_klines(60).to_csv(caminho, index=False)
+    df = carregar_klines('SOL/USDT', '1d', 60)
+    assert len(df) == 60
+    assert pd.api.types.is_datetime64_any_dtype(df['timestamp'])
+
+def test_cache_depende_do_limite(sem_conexao):
+    conn = StubConnection(make_klines(60))
+    carregar_klines('SOL/USDT', '1d', 20, conn=StubConnection(make_klines(20)))
+    # Um cache de 20 candles não pode ser usado para um pedido de 60
+    df = carregar_klines('SOL/USDT', '1d', 60, conn=conn)
+    assert conn.chamadas == [('SOL/USDT', '1d', 60)]
+    assert len(df) == 60
+
+def test_atualizar_baixa_e_grava_cache(sem_conexao):
+    conn = StubConnection(make_klines(60))
+    carregar_klines('SOL/USDT', '1d', 60, atualizar=True, conn=conn)
+    assert conn.chamadas == [('SOL/USDT', '1d', 60)]
+    assert len(pd.read_csv(caminho_cache('SOL/USDT', '1d', 60))) == 60
+
+def test_arquivo_do_usuario_somente_leitura(sem_conexao):
+    arquivo = sem_conexao / 'meu.csv'
+    with pytest.raises(FileNotFoundError):
+        carregar_klines('SOL/USDT', '1d', 60, arquivo=str(arquivo))
+    assert not arquivo.exists()
+    make_klines(30).to_csv(arquivo, index=False)
+    conteudo = arquivo.read_text()
+    conn = StubConnection(make_klines(60))
+    df = carregar_klines('SOL/USDT', '1d', 60, atualizar=True, arquivo=str(arquivo), conn=conn)
+    assert len(df) == 30
+    assert conn.chamadas == []
+    assert arquivo.read_text() == conteudo
+
+def test_run_backtest_offline_sem_matplotlib(sem_conexao, monkeypatch, capsys):
+    import run_backtest
+    monkeypatch.delitem(sys.modules, 'matplotlib', raising=False)
+    monkeypatch.delitem(sys.modules, 'matplotlib.pyplot', raising=False)
+    arquivo = sem_conexao / 'candles.csv'
+    make_klines(60).to_csv(arquivo, index=False)
+    assert run_backtest.main(limit=60, short_window=2, long_window=5, arquivo=str(arquivo), graficos=False) == 0
+    assert 'matplotlib' not in sys.modules
+    assert 'Fator de Lucro' in capsys.readouterr().out
+
+@pytest.mark.parametrize('short_window,long_window', [(2, 5), (3, 8), (20, 28)])
+def test_backtest_rapido_igual_ao_backtester(short_window, long_window):
+    df = make_klines(300)
+    closes = df['close'].tolist()
+    esperado_saldo, esperado_trades = Backtester().run(df.copy(), TradingStrategy(short_window, long_window))
+    sinais = backtest_rapido.calcular_sinais(closes, short_window, long_window)
+    saldo, trades = backtest_rapido.simular(closes, sinais)
+    assert saldo == esperado_saldo
+    assert trades == esperado_trades
+
+@pytest.fixture
+def otimizador_pequeno(monkeypatch):
+    import otimizador_multi
+    monkeypatch.setattr(otimizador_multi, 'LIMIT', 60)
+    monkeypatch.setattr(otimizador_multi, 'GRID', {'short_window': [2, 3], 'long_window': [5, 8]})
+    return otimizador_multi
+
+def test_otimizador_com_cache_nao_conecta(sem_conexao, otimizador_pequeno):
+    os.makedirs(config.dados_cache)
+    for symbol in ('SOL/USDT', 'BTC/USDT'):
+        make_klines(60).to_csv(caminho_cache(symbol, '1d', 60), index=False)
+    resultados = otimizador_pequeno.otimizar_parametros(['SOL/USDT', 'BTC/USDT'], ['1d'])
+    assert set(resultados) == {'SOL/USDT', 'BTC/USDT'}
+    assert all('1d' in r for r in resultados.values())
+    assert dados._conn is None
+
+def test_otimizador_cria_conexao_uma_vez(sem_conexao, otimizador_pequeno, monkeypatch):
+    criadas = []
+    class FakeConnection(StubConnection):
+        def __init__(self, api_key, api_secret, testnet=False):
+            super().__init__(make_klines(60))
+            criadas.append(self)
+    sys.modules['conexao'].BinanceConnection = FakeConnection
+    otimizador_pequeno.otimizar_parametros(['SOL/USDT', 'BTC/USDT'], ['1d'])
+    assert len(criadas) == 1
+    assert len(criadas[0].chamadas) == 2
+    assert dados._conn is criadas[0]
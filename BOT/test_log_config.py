@@ -0,0 +1,109 @@
+import json
+import logging
+import logging.handlers
+import config
+import log_config
+from log_config import ConsoleFormatter, JsonFormatter, RateLimitFilter
+
+def make_record(msg, args=(), level=logging.INFO, **extra):
+    record = logging.LogRecord('bot', level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+def test_rate_limit_ciclo():
+    # Mensagens repetidas do ciclo são suprimidas dentro do intervalo
+    filtro = RateLimitFilter(intervalo=60)
+    assert filtro.filter(make_record('Saldo USDT: %.8f', (1.0,), ciclo='saldo'))
+    assert not filtro.filter(make_record('Saldo USDT: %.8f', (1.0,), ciclo='saldo'))
+    # Texto diferente na mesma tag passa imediatamente
+    assert filtro.filter(make_record('Saldo USDT: %.8f', (2.0,), ciclo='saldo'))
+    # Mensagens fora do ciclo e erros nunca são suprimidos
+    assert filtro.filter(make_record('Ordem enviada'))
+    assert filtro.filter(make_record('Ordem enviada'))
+    assert filtro.filter(make_record('Saldo USDT: %.8f', (2.0,), level=logging.ERROR, ciclo='saldo'))
+
+def test_rate_limit_mudanca_de_posicao():
+    # Voltar a um estado já registrado no intervalo não pode ser suprimido
+    filtro = RateLimitFilter(intervalo=60)
+    assert filtro.filter(make_record('Nenhuma posição aberta.', ciclo='posicao'))
+    assert filtro.filter(make_record('Há posição aberta.', ciclo='posicao'))
+    assert filtro.filter(make_record('Nenhuma posição aberta.', ciclo='posicao'))
+
+def test_rate_limit_contagem_fica_com_o_texto_anterior():
+    # As repetições suprimidas pertencem ao texto antigo, não ao novo estado
+    emitidos = []
+    filtro = RateLimitFilter(intervalo=60, emitir=emitidos.append)
+    for _ in range(4):
+        filtro.filter(make_record('Nenhuma posição aberta.', ciclo='posicao'))
+    novo = make_record('Há posição aberta.', ciclo='posicao')
+    assert filtro.filter(novo)
+    assert novo.suprimidas == 0
+    assert [(r.getMessage(), r.suprimidas) for r in emitidos] == [('Nenhuma posição aberta.', 3)]
+    # Repetições do novo texto contam a partir do zero
+    assert not filtro.filter(make_record('Há posição aberta.', ciclo='posicao'))
+    filtro.flush()
+    assert [(r.getMessage(), r.suprimidas) for r in emitidos[1:]] == [('Há posição aberta.', 1)]
+    filtro.flush()
+    assert len(emitidos) == 2
+
+def test_rate_limit_erro_de_formatacao():
+    # Argumento inválido não pode levantar exceção dentro do filtro (fica para o handler)
+    filtro = RateLimitFilter(intervalo=60)
+    assert filtro.filter(make_record('Saldo USDT: %.8f', (None,), ciclo='saldo'))
+
+def test_rate_limit_conta_suprimidas(monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr(log_config.time, 'monotonic', lambda: agora[0])
+    filtro = RateLimitFilter(intervalo=60)
+    primeiro = make_record('Nenhuma posição aberta.', ciclo='posicao')
+    assert filtro.filter(primeiro)
+    assert primeiro.suprimidas == 0
+    for _ in range(3):
+        agora[0] += 10
+        assert not filtro.filter(make_record('Nenhuma posição aberta.', ciclo='posicao'))
+    # Após o intervalo a mensagem volta a ser emitida com a contagem das suprimidas
+    agora[0] += 60
+    proximo = make_record('Nenhuma posição aberta.', ciclo='posicao')
+    assert filtro.filter(proximo)
+    assert proximo.suprimidas == 3
+    assert '(3 repetições suprimidas)' in ConsoleFormatter('%(message)s').format(proximo)
+
+def test_setup_logging(tmp_path, monkeypatch):
+    arquivo = tmp_path / 'bot.log'
+    monkeypatch.setattr(config, 'log_arquivo', str(arquivo))
+    try:
+        listener = log_config.setup_logging()
+        assert log_config.setup_logging() is listener
+        root = logging.getLogger()
+        assert sum(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers) == 1
+        logger = logging.getLogger('bot.teste')
+        logger.info('Ordem enviada: %s', 'id=1')
+        for _ in range(3):
+            logger.info('Nenhuma posição aberta.', extra={'ciclo': 'posicao'})
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            logger.exception('Falha')
+    finally:
+        log_config.stop_logging()
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers)
+    linhas = [json.loads(l) for l in arquivo.read_text(encoding='utf-8').splitlines()]
+    assert linhas[0]['msg'] == 'Ordem enviada: id=1'
+    assert linhas[1]['msg'] == 'Nenhuma posição aberta.'
+    assert linhas[2]['msg'] == 'Falha'
+    assert 'ValueError: boom' in linhas[2]['exc']
+    # Repetições pendentes são gravadas no encerramento
+    assert linhas[3]['msg'] == 'Nenhuma posição aberta.' and linhas[3]['suprimidas'] == 2
+
+def test_json_formatter():
+    linha = JsonFormatter().format(make_record('Abertura de operação: COMPRA %s @ %s', (0.5, 140.0), suprimidas=2))
+    entry = json.loads(linha)
+    assert '\n' not in linha
+    assert entry['level'] == 'INFO'
+    assert entry['msg'] == 'Abertura de operação: COMPRA 0.5 @ 140.0'
+    assert entry['suprimidas'] == 2
+
+if __name__ == '__main__':
+    test_rate_limit_ciclo()
+    test_rate_limit_mudanca_de_posicao()
+    test_json_formatter()